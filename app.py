@@ -0,0 +1,133 @@
+import streamlit as st
+import simpy
+import time
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from factory_core import (
+    FactoryEnv, MACHINE_POS, GANTRY_POS, FINISHING_POS,
+    COLOR_TABLE, STATUS_TABLE,
+)
+
+# orjson is much faster than stdlib json on the float-heavy figure payload
+# serialized for every chart update
+pio.json.config.default_engine = "orjson"
+
+# Static plot furniture, built once at import time
+STATIC_ANNOTATIONS = [
+    dict(x=MACHINE_POS[0], y=MACHINE_POS[1]+1, text="Machine", showarrow=False),
+    dict(x=GANTRY_POS[0], y=GANTRY_POS[1]+3, text="Gantry", showarrow=False),
+    dict(x=8.5, y=8, text="Curing (24 Cavities)", showarrow=False),
+    dict(x=FINISHING_POS[0], y=FINISHING_POS[1]+1, text="Finishing", showarrow=False),
+]
+STATIC_LAYOUT = dict(
+    xaxis=dict(range=[-2, 18], showgrid=False, zeroline=False, visible=False),
+    yaxis=dict(range=[-1, 10], showgrid=False, zeroline=False, visible=False),
+    height=500, margin=dict(l=10, r=10, t=10, b=10),
+    template="plotly_dark", showlegend=False,
+    annotations=STATIC_ANNOTATIONS,
+)
+
+# --- STREAMLIT UI ---
+st.set_page_config(page_title="Tire Factory Digital Twin", layout="wide")
+
+if 'running' not in st.session_state:
+    st.session_state.running = False
+
+st.title("🏭 Tire Factory Digital Twin")
+
+with st.sidebar:
+    st.header("Simulation Settings")
+    build_t = st.number_input("Build Time (sec)", value=30)
+    cure_t_min = st.number_input("Cure Time (min)", value=12)
+    sim_speed = st.slider("Warp Speed (Sim-sec per Update)", 1, 100, 30)
+    
+    if not st.session_state.running:
+        if st.button("🚀 Start Production", use_container_width=True):
+            st.session_state.running = True
+            # Fresh simulation on every start
+            for k in ('sim_env', 'factory', 'fig', 'last_state'):
+                st.session_state.pop(k, None)
+            st.rerun()
+    else:
+        if st.button("🛑 Stop Production", use_container_width=True):
+            st.session_state.running = False
+            st.rerun()
+
+if st.session_state.running:
+    if 'sim_env' not in st.session_state:
+        sim_env = simpy.Environment()
+        factory = FactoryEnv(sim_env, 24, build_t, cure_t_min * 60)
+        sim_env.process(factory.build_tire_process())
+
+        # Build the figure once; each tick only mutates the trace data, so
+        # the static annotations and layout are not re-serialized per frame.
+        fig = go.Figure(layout=STATIC_LAYOUT)
+        fig.add_trace(go.Scattergl(
+            x=[], y=[],
+            mode='markers+text',
+            marker=dict(size=22, line=dict(width=1.5, color='white')),
+            textposition="top center",
+            hovertemplate="<b>%{text}</b><br>Status: %{customdata}<extra></extra>"
+        ))
+
+        st.session_state.sim_env = sim_env
+        st.session_state.factory = factory
+        st.session_state.fig = fig
+
+    # Only this fragment reruns on each tick; the sidebar and the rest of
+    # the script are left alone instead of re-running in a blocking loop.
+    @st.fragment(run_every=0.1)
+    def tick():
+        sim_env = st.session_state.sim_env
+        factory = st.session_state.factory
+        fig = st.session_state.fig
+
+        # Step events up to the warp target, but never for more than ~20 ms
+        # of wall clock so a dense event heap can't stall the frame.
+        target = sim_env.now + sim_speed
+        deadline = time.perf_counter() + 0.02
+        while sim_env.peek() <= target and time.perf_counter() < deadline:
+            sim_env.step()
+        # If the budget wasn't exhausted, advance the clock the rest of the
+        # way; otherwise target would be re-anchored to a stalled now and
+        # the sim freezes whenever the next event lies beyond one warp-step.
+        if sim_env.now < target and time.perf_counter() < deadline:
+            sim_env.run(until=target)
+
+        m_col1, m_col2, m_col3 = st.columns(3)
+        m_col1.metric("Gantry Inventory", len(factory.gantry_queue))
+        m_col2.metric("Tires Finished", factory.total_finished)
+        in_use = factory.num_cavities - len(factory.free_cavities)
+        utilization = (in_use / factory.num_cavities) * 100
+        m_col3.metric("Cavity Utilization", f"{utilization:.1f}%")
+
+        # Rebuild trace data only when something actually moved; long cure
+        # phases leave many ticks with an identical picture.
+        state = (len(factory.gantry_queue), factory.total_finished,
+                 factory.alive.tobytes(), factory.tire_x.tobytes(),
+                 factory.tire_y.tobytes(), factory.tire_color_idx.tobytes())
+        if state != st.session_state.get('last_state'):
+            st.session_state.last_state = state
+
+            mask = factory.alive
+            xs = factory.tire_x[mask]
+            ys = factory.tire_y[mask]
+            colors = COLOR_TABLE[factory.tire_color_idx[mask]]
+            ids = factory.tire_id[mask]
+            statuses = STATUS_TABLE[factory.tire_status_idx[mask]]
+
+            with fig.batch_update():
+                fig.data[0].x = xs
+                fig.data[0].y = ys
+                fig.data[0].marker.color = colors
+                fig.data[0].text = ids if len(ids) < 40 else None
+                fig.data[0].customdata = statuses
+
+        # Stable key so Plotly.react() diffs the traces in place instead of
+        # tearing down and recreating the chart component every tick.
+        st.plotly_chart(fig, use_container_width=True, key="factory_map")
+
+    tick()
+else:
+    st.info("Click 'Start Production' in the sidebar to begin.")
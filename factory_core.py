@@ -0,0 +1,142 @@
+# Simulation model for the tire factory, kept free of Streamlit/Plotly
+# imports so it can run headless (e.g. under PyPy, whose JIT speeds up
+# SimPy's pure-Python heapq + generator event loop 4-10x) for parameter
+# sweeps: `pypy3 factory_core.py`.
+import simpy
+from collections import deque
+import numpy as np
+
+# --- CONFIGURATION & COORDINATES ---
+MACHINE_POS = (0, 5)
+GANTRY_POS = (2, 5)
+FINISHING_POS = (15, 5)
+CAVITY_COLS = 8
+CAVITY_ROWS = 3
+MAX_TIRES = 512
+
+# Coordinates for 24 cavities in a grid; rows are indexed by cavity slot
+# so a lookup is an array view rather than a fresh tuple
+CAVITY_POS = np.array(
+    [(5 + c, 3 + r * 2) for r in range(CAVITY_ROWS) for c in range(CAVITY_COLS)],
+    dtype=np.float32,
+)
+
+# Lookup tables for the per-tire index arrays below
+COLOR_TABLE = np.array(["limegreen", "black"])
+COLOR_GREEN, COLOR_BLACK = 0, 1
+STATUS_TABLE = np.array(["Building", "In Gantry", "Curing", "Finished"])
+STATUS_BUILDING, STATUS_IN_GANTRY, STATUS_CURING, STATUS_FINISHED = range(4)
+
+SAMPLE_BUF_SIZE = 1024
+
+class FactoryEnv:
+    def __init__(self, env, num_cavities, build_time, cure_time):
+        self.env = env
+        self.num_cavities = num_cavities
+        self.build_time = build_time
+        self.cure_time = cure_time
+        # Cavity contention is a plain free-index deque plus one event that
+        # re-fires on release; simpy.Resource's per-request event machinery
+        # is overkill for 24 almost-always-available cavities.
+        self.free_cavities = deque(range(num_cavities))
+        self.cavity_released = env.event()
+        self.total_finished = 0
+        # Insertion-ordered dict used as an ordered set of slots: delete is
+        # O(1) where list.remove would scan the whole queue.
+        self.gantry_queue = {}
+
+        # Structure-of-arrays tire state: each tire is a slot index into
+        # these preallocated arrays, so the render path can slice them
+        # directly instead of looping over objects.
+        self.tire_x = np.zeros(MAX_TIRES, dtype=np.float32)
+        self.tire_y = np.zeros(MAX_TIRES, dtype=np.float32)
+        self.tire_color_idx = np.zeros(MAX_TIRES, dtype=np.uint8)
+        self.tire_status_idx = np.zeros(MAX_TIRES, dtype=np.uint8)
+        self.tire_id = np.empty(MAX_TIRES, dtype=object)
+        self.alive = np.zeros(MAX_TIRES, dtype=bool)
+        self.free_slots = deque(range(MAX_TIRES))
+
+        # Batched timeout samples: PCG64 fills a buffer of draws at once
+        # instead of paying per-call sampling overhead per tire.
+        self._rng = np.random.default_rng()
+        self._build_buf = np.empty(0)
+        self._build_i = 0
+        self._cure_buf = np.empty(0)
+        self._cure_i = 0
+
+    def _next_build_time(self):
+        if self._build_i == len(self._build_buf):
+            self._build_buf = self._rng.uniform(self.build_time - 3, self.build_time + 3, SAMPLE_BUF_SIZE)
+            self._build_i = 0
+        dt = self._build_buf[self._build_i]
+        self._build_i += 1
+        return dt
+
+    def _next_cure_time(self):
+        if self._cure_i == len(self._cure_buf):
+            self._cure_buf = self._rng.uniform(self.cure_time - 60, self.cure_time + 60, SAMPLE_BUF_SIZE)
+            self._cure_i = 0
+        dt = self._cure_buf[self._cure_i]
+        self._cure_i += 1
+        return dt
+
+    def build_tire_process(self):
+        tire_count = 1
+        while True:
+            yield self.env.timeout(self._next_build_time())
+            while not self.free_slots:
+                yield self.env.timeout(self.build_time)
+            slot = self.free_slots.popleft()
+            self.tire_id[slot] = f"T{tire_count}"
+            self.tire_x[slot], self.tire_y[slot] = MACHINE_POS
+            self.tire_color_idx[slot] = COLOR_GREEN
+            self.tire_status_idx[slot] = STATUS_BUILDING
+            self.alive[slot] = True
+            self.env.process(self.tire_lifecycle(slot))
+            tire_count += 1
+
+    def tire_lifecycle(self, slot):
+        self.tire_status_idx[slot] = STATUS_IN_GANTRY
+        self.tire_x[slot] = GANTRY_POS[0]
+        self.tire_y[slot] = GANTRY_POS[1] + (len(self.gantry_queue) * 0.2)
+        self.gantry_queue[slot] = None
+
+        while not self.free_cavities:
+            yield self.cavity_released
+        del self.gantry_queue[slot]
+
+        idx = self.free_cavities.popleft()
+        self.tire_status_idx[slot] = STATUS_CURING
+        self.tire_x[slot], self.tire_y[slot] = CAVITY_POS[idx]
+
+        # Curing and finishing are plain "wait T, then act" steps, so they
+        # run as timeout callbacks instead of keeping this generator
+        # suspended on the heap for the whole cure.
+        cure_done = self.env.timeout(self._next_cure_time())
+        cure_done.callbacks.append(lambda _evt, s=slot, i=idx: self._finish_cure(s, i))
+
+    def _finish_cure(self, slot, idx):
+        self._release_cavity(idx)
+        self.tire_color_idx[slot] = COLOR_BLACK
+        self.tire_status_idx[slot] = STATUS_FINISHED
+        self.tire_x[slot], self.tire_y[slot] = FINISHING_POS
+        finish_done = self.env.timeout(20)
+        finish_done.callbacks.append(lambda _evt, s=slot: self._retire(s))
+
+    def _retire(self, slot):
+        self.total_finished += 1
+        self.alive[slot] = False
+        self.free_slots.append(slot)
+
+    def _release_cavity(self, idx):
+        self.free_cavities.append(idx)
+        self.cavity_released.succeed()
+        self.cavity_released = self.env.event()
+
+if __name__ == "__main__":
+    # Headless run: one simulated day with the default UI parameters.
+    env = simpy.Environment()
+    factory = FactoryEnv(env, 24, 30, 720)
+    env.process(factory.build_tire_process())
+    env.run(until=86400)
+    print(factory.total_finished)